@@ -264,7 +264,7 @@ class BuildOrUpdateActivity(ActivityBase):
                 )
 
             # Reload so the new activity is recognized immediately
-            being.activity_loader.reload_activities()
+            await being.activity_loader.reload_activities()
 
             return ActivityResult(
                 success=True,
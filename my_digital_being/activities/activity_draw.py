@@ -8,6 +8,15 @@ from framework.api_management import api_manager
 
 logger = logging.getLogger(__name__)
 
+# Activities are re-instantiated on every run, so the skill is shared at module level
+image_skill = ImageGenerationSkill(
+    {
+        "enabled": True,
+        "max_generations_per_day": 50,
+        "supported_formats": ["png", "jpg"],
+    }
+)
+
 
 @activity(
     name="draw",
@@ -26,15 +35,6 @@ class DrawActivity(ActivityBase):
         try:
             logger.info("Starting drawing activity")
 
-            # Initialize the image generation skill with configuration
-            image_skill = ImageGenerationSkill(
-                {
-                    "enabled": True,
-                    "max_generations_per_day": 50,
-                    "supported_formats": ["png", "jpg"],
-                }
-            )
-
             # Verify the skill can generate images
             if not await image_skill.can_generate():
                 error_msg = "Image generation is not available at this time"
@@ -1,10 +1,18 @@
+import asyncio
 import logging
 from typing import Dict, Any, List
 
 from framework.activity_decorator import activity, ActivityBase, ActivityResult
+from framework.activity_helpers import (
+    format_kv_lines,
+    get_fallback_configs,
+    get_fallback_memory,
+)
 from framework.api_management import api_manager
+from framework.composio_integration import composio_manager
 from framework.memory import Memory
 from skills.skill_chat import chat_skill
+from skills.skill_x_api import MAX_TWEET_LENGTH, truncate_tweet
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +33,7 @@ class PostTweetActivity(ActivityBase):
 
     def __init__(self):
         super().__init__()
-        self.max_length = 280
+        self.max_length = MAX_TWEET_LENGTH
         # The Composio action name from your logs
         self.composio_action = "TWITTER_CREATION_OF_A_POST"
         # If you know your Twitter username, you can embed it in the link
@@ -58,11 +66,10 @@ class PostTweetActivity(ActivityBase):
                 return ActivityResult(success=False, error=chat_response["error"])
 
             tweet_text = chat_response["data"]["content"].strip()
-            if len(tweet_text) > self.max_length:
-                tweet_text = tweet_text[: self.max_length - 3] + "..."
+            tweet_text = truncate_tweet(tweet_text, self.max_length)
 
             # 4) Post the tweet via Composio
-            post_result = self._post_tweet_via_composio(tweet_text)
+            post_result = await self._post_tweet_via_composio(tweet_text)
             if not post_result["success"]:
                 error_msg = post_result.get(
                     "error", "Unknown error posting tweet via Composio"
@@ -106,11 +113,7 @@ class PostTweetActivity(ActivityBase):
             return maybe_config
 
         # fallback
-        from framework.main import DigitalBeing
-
-        being = DigitalBeing()
-        being.initialize()
-        return being.configs.get("character_config", {})
+        return get_fallback_configs().get("character_config", {})
 
     def _get_recent_tweets(self, shared_data, limit: int = 10) -> List[str]:
         """
@@ -120,21 +123,14 @@ class PostTweetActivity(ActivityBase):
         memory_obj: Memory = system_data.get("memory_ref")
 
         if not memory_obj:
-            from framework.main import DigitalBeing
-
-            being = DigitalBeing()
-            being.initialize()
-            memory_obj = being.memory
+            memory_obj = get_fallback_memory()
 
-        recent_activities = memory_obj.get_recent_activities(limit=50, offset=0)
-        tweets = []
-        for act in recent_activities:
-            if act.get("activity_type") == "PostTweetActivity" and act.get("success"):
-                tweet_body = act.get("data", {}).get("content", "")
-                if tweet_body:
-                    tweets.append(tweet_body)
-
-        return tweets[:limit]
+        recent_tweets = memory_obj.get_recent_activities_by_type(
+            "PostTweetActivity",
+            limit=limit,
+            predicate=lambda act: bool((act.get("data") or {}).get("content")),
+        )
+        return [act["data"]["content"] for act in recent_tweets]
 
     def _build_chat_prompt(
         self, personality: Dict[str, Any], recent_tweets: List[str]
@@ -142,8 +138,7 @@ class PostTweetActivity(ActivityBase):
         """
         Construct the user prompt referencing personality + last tweets.
         """
-        trait_lines = [f"{t}: {v}" for t, v in personality.items()]
-        personality_str = "\n".join(trait_lines)
+        personality_str = format_kv_lines(personality)
 
         if recent_tweets:
             last_tweets_str = "\n".join(f"- {txt}" for txt in recent_tweets)
@@ -159,20 +154,19 @@ class PostTweetActivity(ActivityBase):
             f"but not repeating old tweets. Avoid hashtags or repeated phrases.\n"
         )
 
-    def _post_tweet_via_composio(self, tweet_text: str) -> Dict[str, Any]:
+    async def _post_tweet_via_composio(self, tweet_text: str) -> Dict[str, Any]:
         """
         Post a tweet using the "Creation of a post" Composio action.
         The response returns {'successfull': True, ...}, not 'success'.
         We'll check 'successfull' or fallback if needed.
         """
         try:
-            from framework.composio_integration import composio_manager
-
             logger.info(
                 f"Posting tweet via Composio action='{self.composio_action}', text='{tweet_text[:50]}...'"
             )
 
-            response = composio_manager._toolset.execute_action(
+            response = await asyncio.to_thread(
+                composio_manager._toolset.execute_action,
                 action=self.composio_action,
                 params={"text": tweet_text},
                 entity_id="MyDigitalBeing",
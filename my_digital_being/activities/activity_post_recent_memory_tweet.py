@@ -1,14 +1,143 @@
+import asyncio
+import binascii
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, List
-from urllib.parse import urlparse
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from framework.activity_decorator import activity, ActivityBase, ActivityResult
+from framework.activity_helpers import (
+    format_kv_lines,
+    get_fallback_configs,
+    get_fallback_memory,
+)
 from framework.api_management import api_manager
+from framework.composio_integration import composio_manager
 from framework.memory import Memory
 from skills.skill_chat import chat_skill
+from skills.skill_x_api import MAX_TWEET_LENGTH, truncate_tweet
+
+try:
+    # SIMD-accelerated base64, if installed
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    _b64encode = functools.partial(binascii.b2a_base64, newline=False)
 
 logger = logging.getLogger(__name__)
 
+# http(s) URL with a host and no whitespace; all we need before downloading
+_HTTP_URL_RE = re.compile(r"https?://[^\s/]+(/\S*)?")
+
+COMPOSIO_ENTITY_ID = "MyDigitalBeing"
+MEDIA_UPLOAD_ACTION = "TWITTER_MEDIA_UPLOAD_MEDIA"
+
+# Twitter rejects images larger than 5 MB, so don't bother downloading them
+MAX_MEDIA_BYTES = 5 * 1024 * 1024
+# A multiple of 3, so full chunks base64-encode without leftover bytes
+DOWNLOAD_CHUNK_SIZE = 48 * 1024
+
+# A new activity instance is created for every run, so the HTTP session used to
+# download drawings lives at module level to keep its connection pool alive.
+_http_session = None
+
+
+async def _get_http_session():
+    """Return the shared aiohttp session, creating it on first use."""
+    import aiohttp
+
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=600,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=60),
+        )
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared aiohttp session."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
+async def cleanup():
+    """Called by ActivityLoader before this module is reloaded and on shutdown."""
+    await close_http_session()
+
+
+# Twitter media IDs already uploaded, by source URL, so the same drawing isn't
+# downloaded and uploaded again on later runs. Media IDs expire after a day.
+MEDIA_ID_CACHE_SIZE = 128
+MEDIA_ID_TTL = 12 * 60 * 60
+_media_id_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+
+def _get_cached_media_id(url: str) -> Optional[str]:
+    """Return the media ID previously uploaded for url, if still valid."""
+    entry = _media_id_cache.get(url)
+    if entry is None:
+        return None
+    media_id, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _media_id_cache[url]
+        return None
+    _media_id_cache.move_to_end(url)
+    return media_id
+
+
+def _cache_media_id(url: str, media_id: str):
+    """Remember the media ID uploaded for url, evicting the least recently used."""
+    _media_id_cache[url] = (media_id, time.monotonic() + MEDIA_ID_TTL)
+    _media_id_cache.move_to_end(url)
+    if len(_media_id_cache) > MEDIA_ID_CACHE_SIZE:
+        _media_id_cache.popitem(last=False)
+
+
+async def _read_as_base64(response) -> Optional[str]:
+    """
+    Stream a response body into a base64 string, encoding it chunk by chunk
+    so the raw image is never held in memory as a whole.
+    Returns None if the body exceeds MAX_MEDIA_BYTES.
+    """
+    # Size the output up front from Content-Length (when sent) so it isn't
+    # regrown on every chunk; slice assignment still grows it if needed.
+    expected = min(response.content_length or 0, MAX_MEDIA_BYTES)
+    encoded = bytearray((expected + 2) // 3 * 4)
+    pos = 0
+    remainder = b""
+    total = 0
+    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_MEDIA_BYTES:
+            # Drop the connection rather than draining the rest of the body
+            response.close()
+            return None
+        # base64 works on 3-byte groups; carry any leftover bytes to the next chunk
+        data = remainder + chunk if remainder else chunk
+        aligned = len(data) - len(data) % 3
+        piece = _b64encode(data[:aligned])
+        encoded[pos : pos + len(piece)] = piece
+        pos += len(piece)
+        remainder = data[aligned:]
+    piece = _b64encode(remainder)
+    encoded[pos : pos + len(piece)] = piece
+    pos += len(piece)
+    del encoded[pos:]
+    # Composio JSON-encodes action params, so the content has to be a str;
+    # base64 is pure ASCII, which is the cheapest codec to decode with.
+    return encoded.decode("ascii")
+
 
 @activity(
     name="post_recent_memories_tweet",
@@ -26,19 +155,25 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
 
     def __init__(self, num_activities_to_fetch: int = 10):
         super().__init__()
-        self.max_length = 280
+        self.max_length = MAX_TWEET_LENGTH
         self.composio_action = "TWITTER_CREATION_OF_A_POST"
         self.twitter_username = "YourUserName"
 
         # Activity types to ignore in memory results
-        self.ignored_activity_types = [
-            "PostRecentMemoriesTweetActivity",  # ignore itself
-            "PostTweetActivity",
-        ]
+        self.ignored_activity_types = frozenset(
+            {
+                "PostRecentMemoriesTweetActivity",  # ignore itself
+                "PostTweetActivity",
+            }
+        )
 
         # How many recent memory entries to consider
         self.num_activities_to_fetch = num_activities_to_fetch
 
+        # Max number of drawings downloaded/uploaded to Twitter at once
+        self.media_upload_concurrency = 5
+        self._upload_semaphore = asyncio.Semaphore(self.media_upload_concurrency)
+
     async def execute(self, shared_data) -> ActivityResult:
         try:
             logger.info("Starting PostRecentMemoriesTweetActivity...")
@@ -55,9 +190,13 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
             objectives_data = character_config.get("objectives", {})
             # For example: objectives_data might be {"primary": "Spread positivity"}
 
-            # 3) Fetch recent memories, ignoring certain activity types
+            # 3) Fetch recent memories, ignoring certain activity types.
+            # One read from memory serves both this and step 4.
+            recent_activities = self._get_memory(shared_data).get_recent_activities(
+                limit=50, offset=0
+            )
             recent_memories = self._get_recent_memories(
-                shared_data, limit=self.num_activities_to_fetch
+                recent_activities, limit=self.num_activities_to_fetch
             )
             if not recent_memories:
                 logger.info("No relevant memories found to tweet about.")
@@ -66,12 +205,20 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
                 )
 
             # 4) Find which memories we used last time (to avoid repeats)
-            used_memories_last_time = self._get_memories_used_last_time(shared_data)
+            used_memories_last_time = self._get_memories_used_last_time(
+                recent_activities
+            )
             logger.info(f"Memories used last time: {used_memories_last_time}")
 
             # Filter out any overlap
+            fingerprints = [self._fingerprint_memory(m) for m in recent_memories]
             new_memories = [
-                m for m in recent_memories if m not in used_memories_last_time
+                m
+                for m, fp in zip(recent_memories, fingerprints)
+                if fp not in used_memories_last_time
+            ]
+            new_fingerprints = [
+                fp for fp in fingerprints if fp not in used_memories_last_time
             ]
 
             # If all are duplicates, we skip tweeting
@@ -88,90 +235,102 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
                 new_memories=new_memories,
             )
 
-            # 6) Extract drawing URLs and upload to Twitter media
+            # 6) Extract drawing URLs and start uploading them to Twitter media
+            # in the background, while the tweet text is being generated
             drawing_urls = self._extract_drawing_urls(new_memories)
-            media_ids = await self._upload_drawings_to_twitter(drawing_urls)
-            
-            # 7) Use chat skill to generate the tweet text
-            chat_response = await chat_skill.get_chat_completion(
-                prompt=prompt_text,
-                system_prompt=(
-                    "You are an AI that composes tweets with the given personality and objectives. "
-                    "Tweet must be under 280 chars."
-                ),
-                max_tokens=200,
+            media_task = asyncio.create_task(
+                self._upload_drawings_to_twitter(drawing_urls)
             )
-            if not chat_response["success"]:
-                return ActivityResult(success=False, error=chat_response["error"])
-
-            tweet_text = chat_response["data"]["content"].strip()
-            if len(tweet_text) > self.max_length:
-                tweet_text = tweet_text[: self.max_length - 3] + "..."
-
-            # 8) Post to Twitter via Composio
-            post_result = self._post_tweet_via_composio(tweet_text, media_ids)
-            if not post_result["success"]:
-                error_msg = post_result.get(
-                    "error", "Unknown error posting tweet via Composio"
+
+            try:
+                # 7) Use chat skill to generate the tweet text
+                chat_response = await chat_skill.get_chat_completion(
+                    prompt=prompt_text,
+                    system_prompt=(
+                        "You are an AI that composes tweets with the given personality and objectives. "
+                        "Tweet must be under 280 chars."
+                    ),
+                    max_tokens=200,
+                )
+                if not chat_response["success"]:
+                    return ActivityResult(success=False, error=chat_response["error"])
+
+                tweet_text = chat_response["data"]["content"].strip()
+                tweet_text = truncate_tweet(tweet_text, self.max_length)
+
+                # 8) Post to Twitter via Composio, once the media uploads are done
+                media_ids = await media_task
+                post_result = await self._post_tweet_via_composio(tweet_text, media_ids)
+                if not post_result["success"]:
+                    error_msg = post_result.get(
+                        "error", "Unknown error posting tweet via Composio"
+                    )
+                    logger.error(f"Tweet posting failed: {error_msg}")
+                    return ActivityResult(success=False, error=error_msg)
+
+                tweet_id = post_result.get("tweet_id")
+                tweet_link = (
+                    f"https://twitter.com/{self.twitter_username}/status/{tweet_id}"
+                    if tweet_id
+                    else None
                 )
-                logger.error(f"Tweet posting failed: {error_msg}")
-                return ActivityResult(success=False, error=error_msg)
-
-            tweet_id = post_result.get("tweet_id")
-            tweet_link = (
-                f"https://twitter.com/{self.twitter_username}/status/{tweet_id}"
-                if tweet_id
-                else None
-            )
 
-            # 9) Return success, storing the new memories in "data" so we can skip them next time
-            logger.info(
-                f"Successfully posted tweet about recent memories: {tweet_text[:50]}..."
-            )
-            return ActivityResult(
-                success=True,
-                data={
-                    "tweet_id": tweet_id,
-                    "content": tweet_text,
-                    "recent_memories_used": new_memories,  # store these for next run
-                },
-                metadata={
-                    "length": len(tweet_text),
-                    "tweet_link": tweet_link,
-                    "prompt_used": prompt_text,
-                    "model": chat_response["data"].get("model"),
-                    "finish_reason": chat_response["data"].get("finish_reason"),
-                },
-            )
+                # 9) Return success, storing the new memories in "data" so we can skip them next time
+                logger.info(
+                    f"Successfully posted tweet about recent memories: {tweet_text[:50]}..."
+                )
+                return ActivityResult(
+                    success=True,
+                    data={
+                        "tweet_id": tweet_id,
+                        "content": tweet_text,
+                        # store these for next run
+                        "recent_memories_used": new_fingerprints,
+                    },
+                    metadata={
+                        "length": len(tweet_text),
+                        "tweet_link": tweet_link,
+                        "prompt_used": prompt_text,
+                        "model": chat_response["data"].get("model"),
+                        "finish_reason": chat_response["data"].get("finish_reason"),
+                    },
+                )
+            finally:
+                # Don't leave uploads running if we bail out before posting
+                if not media_task.done():
+                    media_task.cancel()
 
         except Exception as e:
             logger.error(f"Failed to post recent memories tweet: {e}", exc_info=True)
             return ActivityResult(success=False, error=str(e))
 
-    def _get_memories_used_last_time(self, shared_data) -> List[str]:
+    def _get_memory(self, shared_data) -> Memory:
         """
-        Look in memory for the most recent successful run of this same activity.
-        Return the list of 'recent_memories_used' from that run, or [] if none.
+        Retrieve the Memory from SharedData['system'] or re-init the Being if not found.
         """
-        system_data = shared_data.get_category_data("system")
-        memory_obj: Memory = system_data.get("memory_ref")
+        memory_obj: Memory = shared_data.get("system", "memory_ref")
         if not memory_obj:
-            from framework.main import DigitalBeing
+            memory_obj = get_fallback_memory()
+        return memory_obj
 
-            being = DigitalBeing()
-            being.initialize()
-            memory_obj = being.memory
-
-        # Search in the last ~10 runs for this activity
-        recent_activities = memory_obj.get_recent_activities(limit=10, offset=0)
+    def _get_memories_used_last_time(
+        self, recent_activities: List[Dict[str, Any]]
+    ) -> Set[str]:
+        """
+        Look in recent_activities for the most recent successful run of this same activity.
+        Return the fingerprints of its 'recent_memories_used', or an empty set if none.
+        """
         for act in recent_activities:
             if act.get(
                 "activity_type"
             ) == "PostRecentMemoriesTweetActivity" and act.get("success"):
                 used = act.get("data", {}).get("recent_memories_used", [])
                 if used:
-                    return used
-        return []
+                    # Older runs stored the full summaries rather than fingerprints
+                    return {
+                        self._fingerprint(u) if " => " in u else u for u in used
+                    }
+        return set()
 
     def _get_character_config(self, shared_data) -> Dict[str, Any]:
         """
@@ -183,71 +342,68 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
             return maybe_config
 
         # fallback
-        from framework.main import DigitalBeing
-
-        being = DigitalBeing()
-        being.initialize()
-        return being.configs.get("character_config", {})
+        return get_fallback_configs().get("character_config", {})
 
-    def _get_recent_memories(self, shared_data, limit: int = 10) -> List[str]:
+    def _get_recent_memories(
+        self, recent_activities: List[Dict[str, Any]], limit: int = 10
+    ) -> List[Dict[str, Any]]:
         """
-        Pull up to 'limit' recent memory items (activities),
+        Pick up to 'limit' memory items from recent_activities,
         ignoring certain activity types in self.ignored_activity_types.
-        We'll just gather a short summary for each activity.
+        The activity dicts are returned as-is; see _summarize_memory for the text form.
         """
-        system_data = shared_data.get_category_data("system")
-        memory_obj: Memory = system_data.get("memory_ref")
-
-        if not memory_obj:
-            from framework.main import DigitalBeing
-
-            being = DigitalBeing()
-            being.initialize()
-            memory_obj = being.memory
-
-        recent_activities = memory_obj.get_recent_activities(limit=50, offset=0)
         memories = []
         for act in recent_activities:
             act_type = act.get("activity_type")
             if act_type in self.ignored_activity_types:
                 continue  # skip
 
-            # Some minimal representation
-            summary = f"{act_type} => {act.get('data', {})}"
-            memories.append(summary)
+            memories.append(act)
 
             if len(memories) >= limit:
                 break
 
         return memories
 
+    @staticmethod
+    def _summarize_memory(memory: Dict[str, Any]) -> str:
+        """
+        Some minimal text representation of a memory item,
+        used in the prompt and (fingerprinted) to remember which memories were already tweeted.
+        """
+        return f"{memory.get('activity_type')} => {memory.get('data', {})}"
+
+    @staticmethod
+    def _fingerprint(summary: str) -> str:
+        """Short, stable hash of a memory summary (hash() is salted per process)."""
+        return hashlib.blake2b(summary.encode(), digest_size=12).hexdigest()
+
+    def _fingerprint_memory(self, memory: Dict[str, Any]) -> str:
+        return self._fingerprint(self._summarize_memory(memory))
+
     def _build_chat_prompt(
         self,
         personality: Dict[str, Any],
         objectives: Dict[str, Any],
-        new_memories: List[str],
+        new_memories: List[Dict[str, Any]],
     ) -> str:
         """
         Construct the user prompt: combine personality + objectives + the new memory summaries,
         and instruct the model to craft a short tweet.
         """
         # Personality lines
-        trait_lines = [f"{t}: {v}" for t, v in personality.items()]
-        personality_str = "\n".join(trait_lines)
+        personality_str = format_kv_lines(personality)
 
         # Objectives lines
-        objective_lines = []
-        for k, v in objectives.items():
-            objective_lines.append(f"{k}: {v}")
         objectives_str = (
-            "\n".join(objective_lines)
-            if objective_lines
-            else "(No objectives specified)"
+            format_kv_lines(objectives) if objectives else "(No objectives specified)"
         )
 
         # Memories
         if new_memories:
-            memories_str = "\n".join(f"- {txt}" for txt in new_memories)
+            memories_str = "\n".join(
+                f"- {self._summarize_memory(m)}" for m in new_memories
+            )
         else:
             memories_str = "(No new memories)"
 
@@ -264,24 +420,23 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
         )
         return prompt
 
-    def _post_tweet_via_composio(self, tweet_text: str, media_ids: List[str]) -> Dict[str, Any]:
+    async def _post_tweet_via_composio(self, tweet_text: str, media_ids: List[str]) -> Dict[str, Any]:
         """
         Post tweet via Composio with optional media_ids.
         """
         try:
-            from framework.composio_integration import composio_manager
-
             logger.info(
                 f"Posting tweet via Composio action='{self.composio_action}', text='{tweet_text[:50]}...', media_count={len(media_ids)}"
             )
 
-            response = composio_manager._toolset.execute_action(
+            response = await asyncio.to_thread(
+                composio_manager._toolset.execute_action,
                 action=self.composio_action,
                 params={
                     "text": tweet_text, 
                     "media__media__ids": media_ids if media_ids else None
                 },
-                entity_id="MyDigitalBeing",
+                entity_id=COMPOSIO_ENTITY_ID,
             )
 
             success_val = response.get("success", response.get("successfull"))
@@ -300,94 +455,126 @@ class PostRecentMemoriesTweetActivity(ActivityBase):
             logger.error(f"Error in Composio tweet post: {e}", exc_info=True)
             return {"success": False, "error": str(e)}
 
-    def _extract_drawing_urls(self, memories: List[str]) -> List[str]:
+    def _extract_drawing_urls(self, memories: List[Dict[str, Any]]) -> List[str]:
         """
         Extract URLs from all DrawActivity entries in memories.
-        Returns a list of valid URLs, empty list if none found.
+        Returns a list of unique valid URLs (in order), empty list if none found.
         """
         drawing_urls = []
-        
+
         for memory in memories:
-            if memory.startswith("DrawActivity =>"):
-                try:
-                    # Extract the JSON-like string after '=>'
-                    data_str = memory.split("=>")[1].strip()
-                    # Convert string representation to dict
-                    data = eval(data_str)
-                    
-                    # Extract URL from image_data
-                    if 'image_data' in data and 'url' in data['image_data']:
-                        url = data['image_data']['url']
-                        # Validate URL
-                        result = urlparse(url)
-                        if all([result.scheme, result.netloc]):
-                            drawing_urls.append(url)
-                        else:
-                            logger.warning(f"Invalid URL format found in DrawActivity: {url}")
-                except Exception as e:
-                    logger.error(f"Failed to extract drawing URL: {e}")
-                    continue
-        
-        return drawing_urls
+            if memory.get("activity_type") != "DrawActivity":
+                continue
+
+            image_data = (memory.get("data") or {}).get("image_data")
+            url = image_data.get("url") if isinstance(image_data, dict) else None
+            if not isinstance(url, str) or not url:
+                continue
+
+            # Validate URL
+            if _HTTP_URL_RE.fullmatch(url):
+                drawing_urls.append(url)
+            else:
+                logger.warning(f"Invalid URL format found in DrawActivity: {url}")
+
+        # The same drawing can show up more than once; only upload it once
+        return list(dict.fromkeys(drawing_urls))
 
     async def _upload_drawings_to_twitter(self, drawing_urls: List[str]) -> List[str]:
         """
         Downloads images from URLs and uploads them to Twitter via Composio.
+        Uploads run concurrently, at most self.media_upload_concurrency at a time.
         Returns a list of Twitter media IDs.
         """
-        import aiohttp
-        import base64
-        from framework.composio_integration import composio_manager
-        
-        media_ids = []
-        
         if not drawing_urls:
-            return media_ids
-            
-        async with aiohttp.ClientSession() as session:
-            for url in drawing_urls:
-                try:
-                    # Download image
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            logger.warning(f"Failed to download image from {url}: {response.status}")
-                            continue
-                            
-                        image_data = await response.read()
-                        
-                    # Convert to base64
-                    base64_image = base64.b64encode(image_data).decode('utf-8')
-                    
-                    # Extract filename from URL or use default
-                    filename = url.split('/')[-1].split('?')[0] or 'image.png'
-                    
-                    # Upload to Twitter via Composio
-                    upload_response = composio_manager._toolset.execute_action(
-                        action="TWITTER_MEDIA_UPLOAD_MEDIA",
-                        params={
-                            "media": {
-                                "name": filename,
-                                "content": base64_image
-                            }
-                        },
-                        entity_id="MyDigitalBeing"
-                    )
-                    
-                    # Composio returns 'successfull' instead of 'successful'
-                    if upload_response.get("successful") or upload_response.get("successfull"):
-                        media_id = upload_response.get("media_id") or upload_response.get("data", {}).get("media_id")
-                        if media_id:
-                            media_ids.append(media_id)
-                            logger.info(f"Successfully uploaded image to Twitter, media_id: {media_id}")
-                        else:
-                            logger.warning(f"Upload succeeded but no media_id returned. Response: {upload_response}")
-                    else:
-                        error = upload_response.get("error", "Unknown error")
-                        logger.warning(f"Failed to upload image to Twitter: {error}")
-                        
-                except Exception as e:
-                    logger.error(f"Error uploading image to Twitter: {e}", exc_info=True)
-                    continue
-                  
-        logger.debug(f"Uploaded drawing URLs to Twitter media: {media_ids}")     
+            return []
+
+        results = await asyncio.gather(
+            *(self._upload_drawing_to_twitter(url) for url in drawing_urls),
+            return_exceptions=True,
+        )
+
+        media_ids = []
+        for url, result in zip(drawing_urls, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error uploading image to Twitter from {url}: {result}",
+                    exc_info=result,
+                )
+            elif result:
+                media_ids.append(result)
+
+        logger.debug("Uploaded drawing URLs to Twitter media: %s", media_ids)
         return media_ids
+
+    async def _upload_drawing_to_twitter(self, url: str) -> Optional[str]:
+        """
+        Download a single image and upload it to Twitter via Composio.
+        Returns the Twitter media ID, or None if the download or upload failed.
+        """
+        media_id = _get_cached_media_id(url)
+        if media_id:
+            logger.info("Reusing Twitter media_id %s for %s", media_id, url)
+            return media_id
+
+        session = await _get_http_session()
+        async with self._upload_semaphore:
+            # Download image
+            async with session.get(url) as response:
+                if response.status != 200:
+                    logger.warning(
+                        "Failed to download image from %s: %s", url, response.status
+                    )
+                    return None
+
+                content_type = response.headers.get("Content-Type", "")
+                if content_type and not content_type.startswith("image/"):
+                    logger.warning("URL %s is not an image: %s", url, content_type)
+                    return None
+
+                if (response.content_length or 0) > MAX_MEDIA_BYTES:
+                    logger.warning(
+                        "Image at %s is too large to upload: %d bytes",
+                        url,
+                        response.content_length,
+                    )
+                    return None
+
+                # Download and convert to base64
+                base64_image = await _read_as_base64(response)
+                if base64_image is None:
+                    logger.warning("Image at %s exceeded %d bytes", url, MAX_MEDIA_BYTES)
+                    return None
+
+            # Extract filename from URL or use default
+            path = url.partition("?")[0].partition("#")[0]
+            filename = path.rpartition("/")[2] or "image.png"
+
+            # Upload to Twitter via Composio
+            upload_response = await asyncio.to_thread(
+                composio_manager._toolset.execute_action,
+                action=MEDIA_UPLOAD_ACTION,
+                params={
+                    "media": {
+                        "name": filename,
+                        "content": base64_image
+                    }
+                },
+                entity_id=COMPOSIO_ENTITY_ID,
+            )
+
+        # Composio returns 'successfull' instead of 'successful'
+        if upload_response.get("successful") or upload_response.get("successfull"):
+            media_id = upload_response.get("media_id") or upload_response.get("data", {}).get("media_id")
+            if media_id:
+                logger.info("Successfully uploaded image to Twitter, media_id: %s", media_id)
+                _cache_media_id(url, media_id)
+                return media_id
+            logger.warning(
+                "Upload succeeded but no media_id returned. Response: %s",
+                upload_response,
+            )
+        else:
+            error = upload_response.get("error", "Unknown error")
+            logger.warning("Failed to upload image to Twitter: %s", error)
+        return None
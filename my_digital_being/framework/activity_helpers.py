@@ -0,0 +1,33 @@
+"""Helpers shared by activities."""
+
+import functools
+from typing import Dict, Any
+
+from .memory import Memory
+
+
+@functools.lru_cache(maxsize=1)
+def get_fallback_configs() -> Dict[str, Any]:
+    """
+    Configs for activities run without SharedData['system'] populated.
+    Loaded once per process, so later edits to the config files are not seen.
+    """
+    from .main import DigitalBeing  # Avoid top-level import loops
+
+    return DigitalBeing().configs
+
+
+def get_fallback_memory() -> Memory:
+    """
+    Memory for activities run without SharedData['system']['memory_ref'].
+    Re-read from storage on every call, so it includes newly stored activities.
+    """
+    return Memory()
+
+
+def format_kv_lines(mapping: Dict[str, Any]) -> str:
+    """
+    Format a config dict (e.g. personality, objectives) as "key: value" lines.
+    Not cached: keying a cache on the items costs about as much as the join.
+    """
+    return "\n".join(f"{k}: {v}" for k, v in mapping.items())
@@ -1,7 +1,9 @@
 import importlib
+import inspect
 import logging
 import re
 from pathlib import Path
+from types import ModuleType
 from typing import Dict, Type, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,7 @@ class ActivityLoader:
             )
 
         self.loaded_activities: Dict[str, Type[Any]] = {}
+        self.loaded_modules: Dict[str, ModuleType] = {}
         logger.info(f"ActivityLoader initialized with path: {self.activities_path}")
 
     def load_activities(self):
@@ -98,6 +101,7 @@ class ActivityLoader:
 
                     activity_class = getattr(module, class_name)
                     self.loaded_activities[module_name] = activity_class
+                    self.loaded_modules[module_name] = module
                     logger.info(
                         f"Successfully loaded activity {module_name} -> class {class_name}"
                     )
@@ -115,7 +119,23 @@ class ActivityLoader:
         """Get all loaded activities (module_name -> class)."""
         return self.loaded_activities.copy()
 
-    def reload_activities(self):
-        """Reload all activities by clearing and reloading."""
+    async def cleanup_activities(self):
+        """
+        Let loaded activity modules release their resources (e.g. HTTP sessions).
+        An activity module opts in by defining a module-level `async def cleanup()`.
+        """
+        for module_name, module in self.loaded_modules.items():
+            cleanup = getattr(module, "cleanup", None)
+            if not inspect.iscoroutinefunction(cleanup):
+                continue
+            try:
+                await cleanup()
+            except Exception as e:
+                logger.error(f"Failed to clean up activity {module_name}: {e}")
+
+    async def reload_activities(self):
+        """Reload all activities by cleaning up, clearing and reloading."""
+        await self.cleanup_activities()
         self.loaded_activities.clear()
+        self.loaded_modules.clear()
         self.load_activities()
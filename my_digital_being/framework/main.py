@@ -87,6 +87,15 @@ class DigitalBeing:
         self.activity_loader.load_activities()
         self.shared_data.initialize()
 
+        # Expose config + memory to activities so they don't re-create a being
+        self.shared_data.update(
+            "system",
+            {
+                "character_config": self.configs.get("character_config", {}),
+                "memory_ref": self.memory,
+            },
+        )
+
         # Set loader in selector
         self.activity_selector.set_activity_loader(self.activity_loader)
 
@@ -130,7 +139,8 @@ class DigitalBeing:
 
         except KeyboardInterrupt:
             logger.info("Shutting down digital being...")
-            self.cleanup()
+        finally:
+            await self.shutdown()
 
     async def execute_activity(self, activity) -> ActivityResult:
         """Execute a selected activity."""
@@ -189,6 +199,11 @@ class DigitalBeing:
         self.state.save()
         logger.info("Cleanup completed")
 
+    async def shutdown(self):
+        """Release activity resources, then run cleanup()."""
+        await self.activity_loader.cleanup_activities()
+        self.cleanup()
+
 
 if __name__ == "__main__":
     import asyncio
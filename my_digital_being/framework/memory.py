@@ -3,7 +3,7 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -113,18 +113,47 @@ class Memory:
         paginated_activities = all_activities[offset : offset + limit]
 
         # Format timestamps for display
+        return [self._format_activity(activity) for activity in paginated_activities]
+
+    def get_recent_activities_by_type(
+        self,
+        activity_type: str,
+        success: Optional[bool] = True,
+        limit: int = 10,
+        offset: int = 0,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recent activities of one type, most recent first.
+        By default only successful ones; pass success=None to get all.
+        An optional predicate on the stored entry is applied before
+        offset/limit, so the window only counts entries that pass it.
+        """
+        matching = [
+            activity
+            for activity in self.short_term_memory
+            if activity["activity_type"] == activity_type
+            and (success is None or bool(activity["success"]) == success)
+            and (predicate is None or predicate(activity))
+        ]
+        matching.sort(key=lambda x: x["timestamp"], reverse=True)
+
         return [
-            {
-                "timestamp": self._format_timestamp(activity["timestamp"]),
-                "activity_type": activity["activity_type"],
-                "success": activity["success"],
-                "error": activity.get("error"),
-                "data": activity.get("data"),
-                "metadata": activity.get("metadata", {}),
-            }
-            for activity in paginated_activities
+            self._format_activity(activity)
+            for activity in matching[offset : offset + limit]
         ]
 
+    def _format_activity(self, activity: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a stored activity for display."""
+        return {
+            "timestamp": self._format_timestamp(activity["timestamp"]),
+            "activity_type": activity["activity_type"],
+            "success": activity["success"],
+            "error": activity.get("error"),
+            "data": activity.get("data"),
+            "metadata": activity.get("metadata", {}),
+        }
+
     def _format_timestamp(self, timestamp_str: str) -> str:
         """Format ISO timestamp to human-readable format."""
         try:
@@ -580,7 +580,7 @@ class DigitalBeingServer:
                 ok = write_activity_code(activity_name, new_code)
                 if not ok:
                     return {"success": False, "message": "Failed to save code"}
-                self.being.activity_loader.reload_activities()
+                await self.being.activity_loader.reload_activities()
                 return {"success": True, "message": "Code updated and reloaded"}
 
             elif command == "save_onboarding_data":
@@ -651,6 +651,9 @@ class DigitalBeingServer:
                     self.being.configs["character_config"] = existing_char
                     self.being.configs["skills_config"] = existing_skills
                     self.being.configs["activity_constraints"] = existing_actc
+                    self.being.shared_data.set(
+                        "system", "character_config", existing_char
+                    )
 
                     return {"success": True, "message": "Onboarding data saved."}
 
@@ -737,6 +740,8 @@ class DigitalBeingServer:
         except Exception as e:
             logger.error(f"Failed to start server: {e}")
             raise
+        finally:
+            await self.being.shutdown()
 
 
 if __name__ == "__main__":
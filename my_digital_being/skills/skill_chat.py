@@ -8,7 +8,7 @@ LiteLLM-based Chat Skill that:
 import logging
 from typing import Optional, Dict, Any
 
-from litellm import completion
+from litellm import acompletion
 from framework.api_management import api_manager
 from framework.main import DigitalBeing
 
@@ -70,7 +70,7 @@ class ChatSkill:
         max_tokens: int = 150,
     ) -> Dict[str, Any]:
         """
-        Use litellm.completion() with model=self.model_name, 
+        Use litellm.acompletion() with model=self.model_name,
         and pass api_key=self._provided_api_key if we have it.
         """
         if not self._initialized:
@@ -87,7 +87,7 @@ class ChatSkill:
             messages.append({"role": "user", "content": prompt})
 
             # Just pass the user-provided key, if any:
-            response = completion(
+            response = await acompletion(
                 model=self.model_name,
                 messages=messages,
                 max_tokens=max_tokens,
@@ -7,6 +7,7 @@ import os
 import openai
 from openai import OpenAI
 import asyncio
+from datetime import date
 from framework.api_management import api_manager
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,7 @@ class ImageGenerationSkill:
         self.max_generations = config.get("max_generations_per_day", 50)
         self.supported_formats = config.get("supported_formats", ["png", "jpg"])
         self.generations_count = 0
+        self.count_date = date.today()
 
         # Register required API keys
         api_manager.register_required_keys("image_generation", ["OPENAI"])
@@ -29,6 +31,10 @@ class ImageGenerationSkill:
             logger.warning("Image generation is disabled")
             return False
 
+        # The limit is per day, so start counting again on a new day
+        if date.today() != self.count_date:
+            self.reset_counts()
+
         if self.generations_count >= self.max_generations:
             logger.warning("Daily generation limit reached")
             return False
@@ -124,3 +130,4 @@ class ImageGenerationSkill:
     def reset_counts(self):
         """Reset the generation counter."""
         self.generations_count = 0
+        self.count_date = date.today()
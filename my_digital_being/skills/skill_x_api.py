@@ -1,7 +1,10 @@
 """X (Twitter) API integration skill."""
 
 import os
+import asyncio
 import logging
+import time
+import unicodedata
 from typing import Dict, Any, Optional
 import requests
 from requests_oauthlib import OAuth1Session
@@ -10,6 +13,77 @@ from framework.api_management import api_manager
 
 logger = logging.getLogger(__name__)
 
+MAX_TWEET_LENGTH = 280
+
+# Code point ranges Twitter counts as one character; anything else
+# (CJK, emoji, ...) counts as two. Mirrors twitter-text's v3 config.
+_SINGLE_WEIGHT_RANGES = (
+    (0x0000, 0x10FF),
+    (0x2000, 0x200D),
+    (0x2010, 0x201F),
+    (0x2032, 0x2037),
+)
+
+
+def _char_weight(ch: str) -> int:
+    cp = ord(ch)
+    for low, high in _SINGLE_WEIGHT_RANGES:
+        if low <= cp <= high:
+            return 1
+    return 2
+
+
+def tweet_length(text: str) -> int:
+    """Length of text as Twitter counts it against the tweet limit."""
+    return sum(_char_weight(ch) for ch in text)
+
+
+def _is_regional_indicator(ch: str) -> bool:
+    return 0x1F1E6 <= ord(ch) <= 0x1F1FF
+
+
+def _splits_cluster(text: str, i: int) -> bool:
+    """Whether cutting text at i would split a user-visible character."""
+    ch, prev = text[i], text[i - 1]
+    cp = ord(ch)
+    if (
+        unicodedata.category(ch).startswith("M")  # combining marks
+        or 0xFE00 <= cp <= 0xFE0F  # variation selectors
+        or 0x1F3FB <= cp <= 0x1F3FF  # skin tone modifiers
+        or ch == "\u200d"
+        or prev == "\u200d"
+    ):
+        return True
+    if _is_regional_indicator(ch) and _is_regional_indicator(prev):
+        # Flags are pairs of regional indicators; only cut between pairs
+        run = 0
+        while i - run > 0 and _is_regional_indicator(text[i - run - 1]):
+            run += 1
+        return run % 2 == 1
+    return False
+
+
+def truncate_tweet(text: str, limit: int = MAX_TWEET_LENGTH) -> str:
+    """
+    Cut text to fit Twitter's weighted length limit, ending with an ellipsis if cut.
+    The cut backs off so it doesn't split combining marks, variation selectors,
+    skin tones, ZWJ emoji sequences or flags; other grapheme clusters (e.g.
+    Hangul jamo, Indic conjuncts) may still be split.
+    """
+    if tweet_length(text) <= limit:
+        return text
+
+    ellipsis = "\u2026"
+    budget = limit - tweet_length(ellipsis)
+    length = 0
+    for i, ch in enumerate(text):
+        length += _char_weight(ch)
+        if length > budget:
+            while i > 0 and _splits_cluster(text, i):
+                i -= 1
+            return text[:i] + ellipsis
+    return text
+
 
 class XAPIError(Exception):
     """Custom exception for X API errors"""
@@ -17,6 +91,45 @@ class XAPIError(Exception):
     pass
 
 
+class TokenBucket:
+    """Async token bucket: `capacity` tokens, refilled evenly over `period` seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        if capacity <= 0 or period <= 0:
+            raise ValueError(
+                f"TokenBucket needs a positive capacity and period, got {capacity}/{period}"
+            )
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def has_token(self) -> bool:
+        """Check whether a token is available right now."""
+        self._refill()
+        return self.tokens >= 1
+
+    async def acquire(self):
+        """Take a token, waiting for the next refill if the bucket is empty."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def reset(self):
+        """Refill the bucket completely."""
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+
 class XAPISkill:
     """Skill for interacting with X (Twitter) API."""
 
@@ -27,6 +140,18 @@ class XAPISkill:
         self.rate_limit = config.get("rate_limit", 100)
         self.cooldown_period = config.get("cooldown_period", 300)
         self.posts_count = 0
+        if self.cooldown_period <= 0:
+            logger.warning(
+                f"Invalid cooldown_period {self.cooldown_period}, using 300 seconds"
+            )
+            self.cooldown_period = 300
+        # Spreads rate_limit posts over each cooldown_period instead of bursting.
+        # rate_limit <= 0 disables posting, as it did with the plain counter.
+        self._bucket = (
+            TokenBucket(self.rate_limit, self.cooldown_period)
+            if self.rate_limit > 0
+            else None
+        )
         self.skill_config = SkillConfig("twitter_posting")
         self.oauth_session: Optional[OAuth1Session] = None
 
@@ -60,8 +185,10 @@ class XAPISkill:
             return False
 
     def can_post(self) -> bool:
-        """Check if posting is allowed based on rate limits."""
-        return self.enabled and self.posts_count < self.rate_limit
+        """Check if posting is allowed right now based on rate limits."""
+        return (
+            self.enabled and self._bucket is not None and self._bucket.has_token()
+        )
 
     async def authenticate(self) -> bool:
         """Set up OAuth session for X API."""
@@ -91,8 +218,11 @@ class XAPISkill:
         self, text: str, media_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """Post a tweet with optional media attachment."""
-        if not self.can_post():
-            return {"success": False, "error": "Rate limit exceeded or skill disabled"}
+        if not self.enabled:
+            return {"success": False, "error": "Skill disabled"}
+
+        if self._bucket is None:
+            return {"success": False, "error": "Rate limit exceeded"}
 
         if not self.oauth_session:
             if not await self.authenticate():
@@ -109,7 +239,8 @@ class XAPISkill:
             if media_id:
                 post_payload["media"] = {"media_ids": [media_id]}
 
-            # Post tweet
+            # Post tweet, waiting for the rate limit if needed
+            await self._bucket.acquire()
             response = self.oauth_session.post(
                 "https://api.twitter.com/2/tweets", json=post_payload
             )
@@ -152,5 +283,7 @@ class XAPISkill:
             return None
 
     def reset_counts(self):
-        """Reset the post counter."""
+        """Reset the post counter and rate limit."""
         self.posts_count = 0
+        if self._bucket is not None:
+            self._bucket.reset()
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "my_digital_being"))
+
+from framework.memory import Memory
+
+
+def _entry(activity_type, minute, success=True, content="x"):
+    return {
+        "timestamp": f"2024-01-01T00:{minute:02d}:00+00:00",
+        "activity_type": activity_type,
+        "success": success,
+        "error": None if success else "boom",
+        "data": {"content": content},
+        "metadata": {},
+    }
+
+
+def _memory(tmp_path, entries):
+    memory = Memory(storage_path=str(tmp_path))
+    memory.short_term_memory = list(entries)
+    return memory
+
+
+def _contents(activities):
+    return [a["data"]["content"] for a in activities]
+
+
+def test_filters_by_type_and_success(tmp_path):
+    memory = _memory(
+        tmp_path,
+        [
+            _entry("PostTweetActivity", 1, content="a"),
+            _entry("DrawActivity", 2, content="draw"),
+            _entry("PostTweetActivity", 3, success=False, content="failed"),
+            _entry("PostTweetActivity", 4, content="b"),
+        ],
+    )
+
+    ok = memory.get_recent_activities_by_type("PostTweetActivity")
+    assert _contents(ok) == ["b", "a"]
+    assert all(a["activity_type"] == "PostTweetActivity" for a in ok)
+
+    failed = memory.get_recent_activities_by_type("PostTweetActivity", success=False)
+    assert _contents(failed) == ["failed"]
+
+
+def test_success_none_returns_all(tmp_path):
+    memory = _memory(
+        tmp_path,
+        [
+            _entry("PostTweetActivity", 1, content="a"),
+            _entry("PostTweetActivity", 2, success=False, content="failed"),
+        ],
+    )
+
+    everything = memory.get_recent_activities_by_type("PostTweetActivity", success=None)
+    assert _contents(everything) == ["failed", "a"]
+
+
+def test_offset_and_limit_window(tmp_path):
+    memory = _memory(
+        tmp_path, [_entry("PostTweetActivity", m, content=str(m)) for m in range(6)]
+    )
+
+    window = memory.get_recent_activities_by_type(
+        "PostTweetActivity", limit=2, offset=1
+    )
+    assert _contents(window) == ["4", "3"]
+
+    tail = memory.get_recent_activities_by_type("PostTweetActivity", limit=5, offset=4)
+    assert _contents(tail) == ["1", "0"]
+
+
+def test_predicate_applies_before_limit(tmp_path):
+    memory = _memory(
+        tmp_path,
+        [
+            _entry("PostTweetActivity", 1, content="a"),
+            _entry("PostTweetActivity", 2, content="b"),
+            _entry("PostTweetActivity", 3, content=""),
+            _entry("PostTweetActivity", 4, content=""),
+        ],
+    )
+
+    recent = memory.get_recent_activities_by_type(
+        "PostTweetActivity",
+        limit=2,
+        predicate=lambda act: bool(act["data"]["content"]),
+    )
+    assert _contents(recent) == ["b", "a"]
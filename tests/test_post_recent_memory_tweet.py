@@ -0,0 +1,86 @@
+import asyncio
+import base64
+import binascii
+import functools
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "my_digital_being"))
+
+import activities.activity_post_recent_memory_tweet as tweet_activity
+
+
+class FakeContent:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunked(self, size):
+        # Ignore the requested size so tests control the chunk boundaries
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, body, chunk_size, content_length=None):
+        self.content = FakeContent(
+            [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        )
+        self.content_length = content_length
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(params=["default", "binascii"])
+def encoder(request, monkeypatch):
+    if request.param == "binascii":
+        monkeypatch.setattr(
+            tweet_activity,
+            "_b64encode",
+            functools.partial(binascii.b2a_base64, newline=False),
+        )
+    return request.param
+
+
+def _read(response):
+    return asyncio.run(tweet_activity._read_as_base64(response))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 7, 11, 48 * 1024 + 1])
+@pytest.mark.parametrize("body_size", [0, 1, 2, 3, 100, 100_000])
+def test_matches_b64encode(encoder, chunk_size, body_size):
+    body = os.urandom(body_size)
+    response = FakeResponse(body, chunk_size, content_length=body_size)
+
+    assert _read(response) == base64.b64encode(body).decode("ascii")
+    assert not response.closed
+
+
+@pytest.mark.parametrize("content_length", [None, 10, 10**9])
+def test_content_length_missing_or_wrong(encoder, content_length):
+    # Missing, too small and too large Content-Length only affect preallocation
+    body = os.urandom(10_000)
+    response = FakeResponse(body, 7, content_length=content_length)
+
+    assert _read(response) == base64.b64encode(body).decode("ascii")
+
+
+def test_oversized_body_is_rejected_and_closed(encoder, monkeypatch):
+    monkeypatch.setattr(tweet_activity, "MAX_MEDIA_BYTES", 1000)
+    response = FakeResponse(os.urandom(1001), 11, content_length=None)
+
+    assert _read(response) is None
+    assert response.closed
+
+
+def test_body_at_limit_is_accepted(encoder, monkeypatch):
+    monkeypatch.setattr(tweet_activity, "MAX_MEDIA_BYTES", 1000)
+    body = os.urandom(1000)
+    response = FakeResponse(body, 11, content_length=1000)
+
+    assert _read(response) == base64.b64encode(body).decode("ascii")
+    assert not response.closed
@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "my_digital_being"))
+
+from skills.skill_x_api import TokenBucket, truncate_tweet, tweet_length
+
+ELLIPSIS = "…"
+
+
+def test_ellipsis_weighs_two():
+    assert tweet_length(ELLIPSIS) == 2
+
+
+def test_short_text_is_unchanged():
+    text = "hello world"
+    assert truncate_tweet(text, 280) is text
+
+
+def test_ascii_over_limit():
+    result = truncate_tweet("a" * 300, 280)
+    assert result == "a" * 278 + ELLIPSIS
+    assert tweet_length(result) == 280
+
+
+def test_cjk_counts_double():
+    text = "你好" * 100  # 200 chars, weight 400
+    assert tweet_length(text) == 400
+
+    result = truncate_tweet(text, 280)
+    assert result == text[:139] + ELLIPSIS
+    assert tweet_length(result) == 280
+
+
+def test_double_weight_char_at_boundary():
+    # 277 ASCII + one CJK char would end at weight 279 > budget of 278
+    text = "a" * 277 + "你" + "b" * 10
+    result = truncate_tweet(text, 280)
+    assert result == "a" * 277 + ELLIPSIS
+    assert tweet_length(result) == 279
+
+
+def test_does_not_split_zwj_sequence():
+    family = "\U0001F468‍\U0001F469‍\U0001F467"
+    text = "a" * 272 + family + "b" * 10
+    result = truncate_tweet(text, 280)
+    assert result == "a" * 272 + ELLIPSIS
+
+
+def test_does_not_strip_variation_selector():
+    heart = "❤️"
+    # The cut lands on U+FE0F; keeping the bare heart would change its look
+    text = "a" * 276 + heart + "b" * 10
+    result = truncate_tweet(text, 280)
+    assert result == "a" * 276 + ELLIPSIS
+
+
+def test_does_not_split_flag():
+    flags = "\U0001F1EF\U0001F1F5" * 3
+    text = "a" * 271 + flags + "b" * 10
+    result = truncate_tweet(text, 280)
+    assert result == "a" * 271 + flags[:2] + ELLIPSIS
+    assert tweet_length(result) <= 280
+
+
+def test_does_not_strip_enclosing_keycap():
+    # U+20E3 has combining class 0 but is still a mark (Me)
+    text = "a" * 277 + "1⃣" + "b" * 10
+    result = truncate_tweet(text, 280)
+    assert result == "a" * 277 + ELLIPSIS
+
+
+def test_does_not_strip_thai_vowel_mark():
+    text = "a" * 277 + "กั" + "b" * 10
+    result = truncate_tweet(text, 280)
+    assert result == "a" * 277 + ELLIPSIS
+
+
+def test_token_bucket_spaces_tokens_after_burst():
+    async def take(bucket, n):
+        times = []
+        for _ in range(n):
+            await bucket.acquire()
+            times.append(time.monotonic())
+        return times
+
+    # 2 tokens per 0.2s: a burst of two, then one every 0.1s
+    bucket = TokenBucket(capacity=2, period=0.2)
+    start = time.monotonic()
+    times = asyncio.run(take(bucket, 4))
+
+    assert times[1] - start < 0.05
+    assert times[2] - start >= 0.09
+    assert times[3] - times[2] >= 0.09
+    assert times[3] - start < 0.5
+
+
+def test_token_bucket_rejects_non_positive_settings():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, period=60)
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=5, period=0)